@@ -1,14 +1,16 @@
 from fastapi import FastAPI, Query, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from pathlib import Path
 from contextlib import asynccontextmanager
-import hashlib
 import json
 import os
+import orjson
 from ae2.retriever.index_store import IndexStore
 from ae2.concepts.compiler import compile_concept
 from ae2.concepts.store import ConceptStore
 from ae2.concepts.errors import ConceptCompileError
+from ae2.rfc.index_builder import hash_file
 
 try:
     from ae2.router.definitional_router import get_target_rfcs
@@ -42,16 +44,23 @@ async def lifespan(app: FastAPI):
     if manifest_path.exists():
         app.state.manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
     if sections_path.exists():
-        h = hashlib.sha256()
-        with sections_path.open("rb") as f:
-            for chunk in iter(lambda: f.read(1024 * 1024), b""):
-                h.update(chunk)
-        app.state.root_hash = h.hexdigest()
+        # Same one-shot mmap digest the builder wrote into manifest["root_hash"]
+        app.state.root_hash = hash_file(sections_path)
     yield
     logger.info("AE v2 lifespan shutdown")
 
 
-app = FastAPI(title="AE v2", lifespan=lifespan)
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content) -> bytes:
+        # Retrieval scores are often numpy scalars, which orjson rejects by default
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+app = FastAPI(title="AE v2", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 class QueryReq(BaseModel):
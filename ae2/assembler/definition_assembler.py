@@ -6,6 +6,7 @@ constructs coherent definitional responses with proper citations.
 """
 
 import logging
+import re
 from typing import Dict, List, Optional, Tuple
 
 from ..contracts.models import Query, QueryResponse, QueryType, RFCSection
@@ -13,6 +14,32 @@ from ..contracts.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Definition quality indicators
+DEFINITION_INDICATORS = (
+    "is defined as",
+    "means",
+    "refers to",
+    "denotes",
+    "represents",
+    "specifies",
+    "defines",
+    "describes",
+)
+
+# Formal definition patterns
+DEFINITION_PATTERNS = (
+    r"(\w+)\s+is\s+defined\s+as",
+    r"(\w+)\s+means",
+    r"(\w+)\s+refers\s+to",
+    r"(\w+)\s+denotes",
+)
+
+# One alternation per check, so each excerpt is scanned once instead of once per pattern
+_INDICATOR_RE = re.compile("|".join(map(re.escape, DEFINITION_INDICATORS)))
+_DEFINITION_RE = re.compile(
+    "|".join([*map(re.escape, DEFINITION_INDICATORS), *DEFINITION_PATTERNS])
+)
+
 
 class DefinitionAssembler:
     """Assembles definitional responses from retrieved RFC sections."""
@@ -22,16 +49,7 @@ class DefinitionAssembler:
         self.strict_mode = settings.strict_definitions
         
         # Definition quality indicators
-        self.definition_indicators = [
-            "is defined as",
-            "means",
-            "refers to",
-            "denotes",
-            "represents",
-            "specifies",
-            "defines",
-            "describes",
-        ]
+        self.definition_indicators = list(DEFINITION_INDICATORS)
         
         self.logger.info(f"Definition assembler initialized (strict_mode: {self.strict_mode})")
     
@@ -99,27 +117,8 @@ class DefinitionAssembler:
     
     def _contains_definition(self, text: str) -> bool:
         """Check if text contains a definition."""
-        text_lower = text.lower()
-        
-        # Check for definition indicators
-        for indicator in self.definition_indicators:
-            if indicator in text_lower:
-                return True
-        
-        # Check for formal definition patterns
-        definition_patterns = [
-            r"(\w+)\s+is\s+defined\s+as",
-            r"(\w+)\s+means",
-            r"(\w+)\s+refers\s+to",
-            r"(\w+)\s+denotes",
-        ]
-        
-        import re
-        for pattern in definition_patterns:
-            if re.search(pattern, text_lower):
-                return True
-        
-        return False
+        # Definition indicators and formal definition patterns in a single pass
+        return _DEFINITION_RE.search(text.lower()) is not None
     
     def _select_best_definition(
         self,
@@ -147,7 +146,7 @@ class DefinitionAssembler:
         quality_indicators = 0
         
         # Formal definition patterns
-        if any(indicator in text for indicator in self.definition_indicators):
+        if _INDICATOR_RE.search(text):
             quality_indicators += 1
         
         # RFC section number indicates formal definition
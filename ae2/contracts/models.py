@@ -7,6 +7,7 @@ type safety, validation, and consistent data structures across the entire
 system.
 """
 
+import re
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
@@ -15,6 +16,9 @@ from uuid import UUID, uuid4
 from pydantic import BaseModel, Field, computed_field, validator
 from pydantic.json import pydantic_encoder
 
+# Length and hex-digit checks fused into one C-level scan for the hash validators
+_SHA256_HEX = re.compile(r"[0-9a-fA-F]{64}")
+
 
 class EvidenceType(str, Enum):
     """Types of evidence that can be cited."""
@@ -62,7 +66,7 @@ class RFCSection(BaseModel):
     @validator('hash')
     def validate_hash(cls, v: str) -> str:
         """Validate that hash is a valid SHA256 hash."""
-        if not v or len(v) != 64 or not all(c in '0123456789abcdef' for c in v.lower()):
+        if not _SHA256_HEX.fullmatch(v):
             raise ValueError('Hash must be a valid SHA256 hash (64 hex characters)')
         return v.lower()
     
@@ -83,7 +87,7 @@ class Evidence(BaseModel):
     @validator('sha256')
     def validate_sha256(cls, v: str) -> str:
         """Validate that sha256 is a valid SHA256 hash."""
-        if not v or len(v) != 64 or not all(c in '0123456789abcdef' for c in v.lower()):
+        if not _SHA256_HEX.fullmatch(v):
             raise ValueError('SHA256 must be 64 hex characters')
         return v.lower()
 
@@ -139,7 +143,7 @@ class Artifact(BaseModel):
     @validator('sha256')
     def validate_sha256(cls, v: str) -> str:
         """Validate that sha256 is a valid SHA256 hash."""
-        if not v or len(v) != 64 or not all(c in '0123456789abcdef' for c in v.lower()):
+        if not _SHA256_HEX.fullmatch(v):
             raise ValueError('SHA256 must be 64 hex characters')
         return v.lower()
 
@@ -246,7 +250,7 @@ class IndexManifest(BaseModel):
     @validator('embeddings_hash', 'metadata_hash')
     def validate_hash(cls, v: str) -> str:
         """Validate that hash is a valid SHA256 hash."""
-        if not v or len(v) != 64 or not all(c in '0123456789abcdef' for c in v.lower()):
+        if not _SHA256_HEX.fullmatch(v):
             raise ValueError('Hash must be a valid SHA256 hash (64 hex characters)')
         return v.lower()
     
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import json
@@ -6,6 +7,7 @@ import pickle
 import numpy as np
 import os
 import re
+import threading
 from scipy import sparse
 from sklearn.metrics.pairwise import cosine_similarity
 
@@ -17,11 +19,18 @@ try:
 except ImportError:
     BM25_AVAILABLE = False
 
+# Distinct (query, options) results kept by IndexStore.search
+SEARCH_CACHE_SIZE = 1024
+
 
 class IndexStore:
     def __init__(self, index_dir: Path):
         self.index_dir = Path(index_dir)
         self.sections: List[Dict] = []
+        # LRU of ranked hits; the store is immutable once loaded, so entries
+        # never go stale for the lifetime of the instance
+        self._search_cache: OrderedDict[tuple, List[Dict]] = OrderedDict()
+        self._search_cache_lock = threading.Lock()
         self._load()
 
     def _load(self):
@@ -36,8 +45,15 @@ class IndexStore:
         # Load BM25 if available
         self.bm25_model = None
         if BM25_AVAILABLE:
+            bm25_token_ids_path = self.index_dir / "bm25_token_ids.npy"
             bm25_tokens_path = self.index_dir / "bm25_tokens.npy"
-            if bm25_tokens_path.exists():
+            if bm25_token_ids_path.exists():
+                try:
+                    self.bm25_model = BM25Okapi(self._load_bm25_corpus())
+                except Exception as e:
+                    print(f"Warning: Failed to load BM25 model: {e}")
+            elif bm25_tokens_path.exists():
+                # Object-array layout written by older builds
                 try:
                     corpus_tokens = np.load(bm25_tokens_path, allow_pickle=True)
                     self.bm25_model = BM25Okapi(corpus_tokens)
@@ -49,6 +65,16 @@ class IndexStore:
         else:
             print("Warning: rank-bm25 not available, using TF-IDF only")
 
+    def _load_bm25_corpus(self) -> List[List[str]]:
+        """Expand the CSR token layout written by scripts/build_index.py."""
+        vocab = np.array(
+            json.loads((self.index_dir / "bm25_vocab.json").read_text()), dtype=object
+        )
+        token_ids = np.load(self.index_dir / "bm25_token_ids.npy", mmap_mode="r")
+        offsets = np.load(self.index_dir / "bm25_offsets.npy").tolist()
+        tokens = vocab[token_ids].tolist()
+        return [tokens[start:end] for start, end in zip(offsets, offsets[1:])]
+
     def _build_bm25_on_fly(self):
         """Build BM25 model from sections if tokens not persisted."""
         if not BM25_AVAILABLE:
@@ -100,6 +126,23 @@ class IndexStore:
         w_tfidf = float(os.getenv("HYBRID_W_TFIDF", "0.6"))
         w_bm25 = float(os.getenv("HYBRID_W_BM25", "0.4"))
 
+        # Every scorer lowercases the query and ignores surrounding whitespace,
+        # so queries differing only in those share a cache entry
+        cache_key = (
+            query.strip().lower(),
+            top_k,
+            tuple(rfc_filter) if rfc_filter else None,
+            mode,
+            w_tfidf,
+            w_bm25,
+        )
+        with self._search_cache_lock:
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                self._search_cache.move_to_end(cache_key)
+        if cached is not None:
+            return _copy_hits(cached)
+
         # TF-IDF scoring
         qv = self.vectorizer.transform([query])
         tfidf_scores = cosine_similarity(qv, self.matrix).ravel()
@@ -183,4 +226,14 @@ class IndexStore:
                     "scores": subscores,
                 }
             )
-        return out
+
+        with self._search_cache_lock:
+            self._search_cache[cache_key] = out
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return _copy_hits(out)
+
+
+def _copy_hits(hits: List[Dict]) -> List[Dict]:
+    """Copy cached hits so callers cannot mutate the cached entries."""
+    return [{**hit, "scores": dict(hit["scores"])} for hit in hits]
@@ -1,9 +1,7 @@
 from __future__ import annotations
 from pathlib import Path
 from typing import List, Dict
-import re, json, pickle, hashlib, datetime as dt
-from sklearn.feature_extraction.text import TfidfVectorizer
-from scipy import sparse
+import re, json, mmap, pickle, hashlib, datetime as dt
 
 # Section headers must start at 1.. (not 0..). Match "1.", "1.2.", etc.
 HEADER = re.compile(r"^(?P<num>(?:[1-9]\d*(?:\.\d+)*))\.\s+(?P<title>.+)$")
@@ -47,11 +45,18 @@ def _maybe_canonicalize(rfc_number: int, title: str) -> str:
             return CANONICAL_826[t]
     return title
 
-def _hash_file(path: Path) -> str:
-    h = hashlib.sha256()
+def hash_file(path: Path, algorithm: str = "sha256") -> str:
+    # sha256 by default: root_hash is compared by /debug/index and existing manifests.
+    # mmap feeds the whole file to one update() call instead of a Python read loop.
+    h = hashlib.new(algorithm)
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+        except (ValueError, OSError):
+            # empty or non-mappable files: fall back to 1 MiB chunked reads
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
     return h.hexdigest()
 
 def _sha256_bytes(b: bytes) -> str:
@@ -173,6 +178,10 @@ def build_index(output_dir: Path, raw_dir: Path = Path("data/rfc_raw")) -> dict:
     with sp.open("w", encoding="utf-8") as f:
         for s in sections: f.write(json.dumps(s) + "\n")
 
+    # sklearn/scipy are only needed here; keep them off the module import path
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from scipy import sparse
+
     corpus = [(s.get("title","")+" "+s.get("excerpt","")+" "+s.get("text","")).strip()
               for s in sections]
     vec = TfidfVectorizer(ngram_range=(1,2), min_df=1, lowercase=True)
@@ -188,7 +197,7 @@ def build_index(output_dir: Path, raw_dir: Path = Path("data/rfc_raw")) -> dict:
         "rfc_numbers": sorted({s["rfc_number"] for s in sections}),
         "sections_path": str(sp),
         "artifacts": ["sections.jsonl","tfidf.pkl","tfidf_matrix.npz"],
-        "root_hash": _hash_file(sec_path),
+        "root_hash": hash_file(sec_path),
     }
     (output_dir/"manifest.json").write_text(json.dumps(manifest, indent=2))
     return manifest
@@ -5,19 +5,78 @@ This module handles loading RFC sections from storage and building
 searchable indexes with content-addressed storage.
 """
 
+import asyncio
 import hashlib
+import hmac
 import json
 import logging
+import mmap
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import orjson
+from pydantic import TypeAdapter
 
 from ..contracts.models import RFCSection, IndexManifest
 from ..contracts.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Lines validated per TypeAdapter call
+VALIDATE_BATCH_LINES = 4096
+
+_SECTIONS_ADAPTER = TypeAdapter(List[RFCSection])
+
+
+def _validate_batch(batch: List[Tuple[int, bytes]], sections: List[RFCSection], errors: List[str]) -> None:
+    """Validate a batch of (line number, line) pairs in one call, retrying line by line on failure.
+    
+    Joining the lines into one array loses their boundaries, so a corrupt line
+    holding several records is caught by the count check and re-parsed alone.
+    """
+    try:
+        validated = _SECTIONS_ADAPTER.validate_json(
+            b"[" + b",".join(line for _, line in batch) + b"]"
+        )
+        if len(validated) == len(batch):
+            sections.extend(validated)
+            return
+    except Exception:
+        pass
+    
+    for line_num, line in batch:
+        try:
+            sections.append(RFCSection.model_validate(orjson.loads(line)))
+        except Exception as e:
+            errors.append(f"Failed to parse line {line_num}: {e}")
+
+
+def _iter_lines(buf: mmap.mmap) -> Iterator[Tuple[int, bytes]]:
+    """Yield (1-based line number, stripped line) for the non-blank lines in a buffer."""
+    for line_num, line in enumerate(iter(buf.readline, b""), 1):
+        line = line.strip()
+        if line:
+            yield line_num, line
+
+
+def _parse_sections(path: Path) -> Tuple[List[RFCSection], List[str]]:
+    """Parse a JSONL file into RFC sections, returning them with any per-line errors."""
+    sections = []
+    errors = []
+    if path.stat().st_size == 0:
+        return sections, errors  # empty files cannot be memory-mapped
+    
+    batch = []
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        for numbered_line in _iter_lines(buf):
+            batch.append(numbered_line)
+            if len(batch) >= VALIDATE_BATCH_LINES:
+                _validate_batch(batch, sections, errors)
+                batch = []
+    if batch:
+        _validate_batch(batch, sections, errors)
+    return sections, errors
+
 
 class IndexBuilder:
     """Builds and manages searchable indexes from RFC sections."""
@@ -27,6 +86,10 @@ class IndexBuilder:
         self.rfc_index_file = settings.rfc_dir / "rfc_index.jsonl"
         self.manifest_file = settings.rfc_dir / "manifest.json"
         self.index_dir = settings.index_dir
+        # (st_mtime_ns, parsed manifest) of the last manifest read
+        self._manifest_cache: Optional[Tuple[int, Dict]] = None
+        # ((st_mtime_ns, st_size), parsed sections) of the last index load
+        self._sections_cache: Optional[Tuple[Tuple[int, int], List[RFCSection]]] = None
         
         # Ensure directories exist
         self.index_dir.mkdir(parents=True, exist_ok=True)
@@ -46,8 +109,9 @@ class IndexBuilder:
         self.logger.info("Building index from RFC sections")
         
         # For now, we'll create a simple index
-        # In the future, this could trigger RFC sync if needed
-        sections = self._load_rfc_sections()
+        # In the future, this could trigger RFC sync if needed.
+        # Parsing and hashing are CPU-bound, so keep them off the event loop.
+        sections = await asyncio.to_thread(self._load_rfc_sections)
         
         if not sections:
             self.logger.warning("No RFC sections found, creating empty index")
@@ -55,7 +119,7 @@ class IndexBuilder:
             return
         
         # Create manifest
-        manifest = self._create_manifest(sections)
+        manifest = await asyncio.to_thread(self._create_manifest, sections)
         
         self.logger.info(f"Index built with {len(sections)} sections")
     
@@ -77,47 +141,42 @@ class IndexBuilder:
             self.logger.warning(f"RFC index file not found: {self.rfc_index_file}")
             return sections
         
-        try:
-            with open(self.rfc_index_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    try:
-                        # Parse JSON line
-                        data = orjson.loads(line)
-                        section = RFCSection(**data)
-                        sections.append(section)
-                    except Exception as e:
-                        self.logger.error(f"Failed to parse line {line_num}: {e}")
-                        continue
-            
-            self.logger.debug(f"Successfully loaded {len(sections)} sections from {self.rfc_index_file}")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to load RFC sections: {e}")
-            return []
+        # build_index and load_documents both land here; reuse the last parse
+        # while the file is unchanged
+        stat = self.rfc_index_file.stat()
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        if self._sections_cache is not None and self._sections_cache[0] == file_key:
+            return list(self._sections_cache[1])
+        
+        # Bad lines are logged and skipped; anything else (I/O errors) propagates
+        # rather than passing for an empty index
+        sections, errors = _parse_sections(self.rfc_index_file)
+        for error in errors:
+            self.logger.error(error)
+        self._sections_cache = (file_key, list(sections))
         
+        self.logger.debug(f"Successfully loaded {len(sections)} sections from {self.rfc_index_file}")
         return sections
     
     def _create_manifest(self, sections: List[RFCSection]) -> IndexManifest:
         """Create a manifest for the RFC sections."""
-        # Calculate hashes
-        section_hashes = [section.hash for section in sections]
-        embeddings_hash = hashlib.sha256(
-            json.dumps(section_hashes, sort_keys=True).encode('utf-8')
-        ).hexdigest()
-        
-        # Create metadata hash
-        metadata = {
-            "rfc_numbers": sorted(list(set(section.rfc_number for section in sections))),
-            "total_sections": len(sections),
-            "section_hashes": section_hashes,
-        }
-        metadata_hash = hashlib.sha256(
-            json.dumps(metadata, sort_keys=True).encode('utf-8')
-        ).hexdigest()
+        # Single pass over the sections. Section hashes are fixed-width hex, so
+        # feeding them back-to-back into one digest is unambiguous.
+        embeddings = hashlib.sha256()
+        rfc_numbers = set()
+        for section in sections:
+            embeddings.update(section.hash.encode('ascii'))
+            rfc_numbers.add(section.rfc_number)
+        embeddings_hash = embeddings.hexdigest()
+        
+        # Metadata hash over a framed canonical form instead of re-encoding
+        # every section hash as JSON
+        metadata = hashlib.sha256()
+        for rfc_number in sorted(rfc_numbers):
+            metadata.update(b"rfc\0%d\n" % rfc_number)
+        metadata.update(b"total_sections\0%d\n" % len(sections))
+        metadata.update(b"embeddings\0" + embeddings_hash.encode('ascii'))
+        metadata_hash = metadata.hexdigest()
         
         manifest = IndexManifest(
             index_id=f"rfc_index_{int(hashlib.sha256(embeddings_hash.encode()).hexdigest()[:8], 16)}",
@@ -130,8 +189,7 @@ class IndexBuilder:
         )
         
         # Save manifest
-        with open(self.manifest_file, 'w', encoding='utf-8') as f:
-            json.dump(manifest.dict(), f, indent=2, sort_keys=True)
+        self._write_manifest(manifest)
         
         self.logger.info(f"Created manifest: {manifest.index_id}")
         return manifest
@@ -148,28 +206,40 @@ class IndexBuilder:
             version=settings.app_version,
         )
         
-        with open(self.manifest_file, 'w', encoding='utf-8') as f:
-            json.dump(manifest.dict(), f, indent=2, sort_keys=True)
+        self._write_manifest(manifest)
         
         self.logger.info("Created empty manifest")
     
+    def _write_manifest(self, manifest: IndexManifest) -> None:
+        """Serialize the manifest to disk (orjson handles datetime natively)."""
+        with open(self.manifest_file, 'wb') as f:
+            f.write(orjson.dumps(
+                manifest.dict(),
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2,
+            ))
+    
+    def _read_manifest(self) -> Dict:
+        """Read the manifest, reusing the last parse while its mtime is unchanged."""
+        mtime_ns = self.manifest_file.stat().st_mtime_ns
+        if self._manifest_cache is None or self._manifest_cache[0] != mtime_ns:
+            self._manifest_cache = (mtime_ns, orjson.loads(self.manifest_file.read_bytes()))
+        return self._manifest_cache[1].copy()
+    
     def get_index_stats(self) -> Dict[str, any]:
         """Get statistics about the index."""
         if not self.index_exists():
             return {"error": "Index does not exist"}
         
         try:
+            # Served from the parse cache after a build or an earlier call
             sections = self._load_rfc_sections()
-            
-            # Load manifest
-            with open(self.manifest_file, 'r', encoding='utf-8') as f:
-                manifest_data = json.load(f)
+            manifest_data = self._read_manifest()
             
             return {
                 "document_count": len(sections),
-                "rfc_numbers": sorted(list(set(section.rfc_number for section in sections))),
+                "rfc_numbers": sorted({section.rfc_number for section in sections}),
                 "manifest": manifest_data,
-                "index_file_size": self.rfc_index_file.stat().st_size if self.rfc_index_file.exists() else 0,
+                "index_file_size": self.rfc_index_file.stat().st_size,
             }
             
         except Exception as e:
@@ -183,22 +253,24 @@ class IndexBuilder:
             return False
         
         try:
-            sections = self._load_rfc_sections()
+            manifest_data = self._read_manifest()
             
-            # Load manifest
-            with open(self.manifest_file, 'r', encoding='utf-8') as f:
-                manifest_data = json.load(f)
+            # Same sections (and parse cache) the manifest was built from
+            sections = self._load_rfc_sections()
             
             # Validate document count
             if len(sections) != manifest_data.get("document_count", 0):
                 self.logger.error("Document count mismatch")
                 return False
             
-            # Validate section hashes
-            section_hashes = [section.hash for section in sections]
-            expected_hashes = manifest_data.get("section_hashes", [])
+            # Roll the section hashes up exactly as _create_manifest does
+            embeddings = hashlib.sha256()
+            for section in sections:
+                embeddings.update(section.hash.encode('ascii'))
             
-            if section_hashes != expected_hashes:
+            # Validate section hashes (constant-time digest comparison)
+            expected_hash = manifest_data.get("embeddings_hash", "")
+            if not hmac.compare_digest(embeddings.hexdigest(), expected_hash):
                 self.logger.error("Section hashes mismatch")
                 return False
             
@@ -209,7 +281,6 @@ class IndexBuilder:
             self.logger.error(f"Index validation failed: {e}")
             return False
 
-
 def main():
     """Main entry point for index building."""
     import asyncio
@@ -6,29 +6,82 @@ of the Aetheriac Engine v2 system with predefined test cases.
 """
 
 import asyncio
-import json
+import itertools
 import logging
 import time
-from typing import Dict, List, Optional
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+import numpy as np
+import orjson
 import pytest
 
-from ..assembler.definition_assembler import DefinitionAssembler
-from ..contracts.models import Query, QueryType
-from ..retriever.hybrid_ranker import HybridRanker
-from ..router.definitional_router import DefinitionalRouter
-from ..storage.index_builder import IndexBuilder
+from ..contracts.models import Query, QueryResponse, QueryType
+
+if TYPE_CHECKING:
+    from ..retriever.hybrid_ranker import HybridRanker
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class GoldenCaseDetail:
+    """Outcome of a single golden test case (fields left as None are omitted)."""
+    
+    test: str
+    query: str
+    status: str
+    expected_type: Optional[QueryType] = None
+    actual_type: Optional[QueryType] = None
+    confidence: Optional[float] = None
+    processing_time_ms: Optional[float] = None
+    citations_count: Optional[int] = None
+    issues: Optional[List[str]] = None
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the plain dict shape used in suite reports."""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if getattr(self, f.name) is not None
+        }
+
+
 class GoldenTestSuite:
     """Golden test suite for validating AE v2 functionality."""
     
+    __slots__ = (
+        "logger",
+        "router",
+        "ranker",
+        "assembler",
+        "index_builder",
+        "definition_tests",
+        "concept_tests",
+        "troubleshooting_tests",
+        "all_tests",
+        "_query_ids",
+    )
+    
+    # Shared across instances so the embedding model is loaded and the
+    # document index is built once per process rather than once per suite
+    _shared_ranker: Optional["HybridRanker"] = None
+    _index_built: bool = False
+    
     def __init__(self):
+        # Pipeline components are imported here rather than at module scope so
+        # collecting this module does not pull in the embedding stack
+        from ..assembler.definition_assembler import DefinitionAssembler
+        from ..retriever.hybrid_ranker import HybridRanker
+        from ..router.definitional_router import DefinitionalRouter
+        from ..storage.index_builder import IndexBuilder
+        
         self.logger = logging.getLogger(f"{__name__}.golden_tests")
         self.router = DefinitionalRouter()
-        self.ranker = HybridRanker()
+        if GoldenTestSuite._shared_ranker is None:
+            GoldenTestSuite._shared_ranker = HybridRanker()
+        self.ranker = GoldenTestSuite._shared_ranker
         self.assembler = DefinitionAssembler()
         self.index_builder = IndexBuilder()
         
@@ -97,10 +150,17 @@ class GoldenTestSuite:
                 "description": "BGP troubleshooting query"
             },
         ]
+        
+        self.all_tests = (*self.definition_tests, *self.concept_tests, *self.troubleshooting_tests)
+        # Monotonic query ids; millisecond timestamps collide within a run
+        self._query_ids = itertools.count()
     
     async def setup(self) -> bool:
         """Setup the test environment."""
         try:
+            if GoldenTestSuite._index_built:
+                return True
+            
             # Ensure index exists
             if not self.index_builder.index_exists():
                 self.logger.info("Building index for golden tests")
@@ -113,6 +173,7 @@ class GoldenTestSuite:
                 return False
             
             self.ranker.build_index(documents)
+            GoldenTestSuite._index_built = True
             self.logger.info(f"Loaded {len(documents)} documents for golden tests")
             return True
             
@@ -120,186 +181,210 @@ class GoldenTestSuite:
             self.logger.error(f"Failed to setup golden tests: {e}")
             return False
     
-    def test_router_classification(self) -> Dict[str, any]:
-        """Test query classification by the router."""
-        results = {
-            "passed": 0,
-            "failed": 0,
-            "total": 0,
-            "details": []
+    def _query_for(self, test_case: Dict) -> Query:
+        """Return the Query for a test case, building it once and reusing it."""
+        query = test_case.get("_query_obj")
+        if query is None:
+            query = test_case["_query_obj"] = Query(text=test_case["query"])
+        return query
+    
+    def _answer(self, query: Query) -> QueryResponse:
+        """Retrieve sections for a query and assemble the definition response."""
+        retrieved_sections = self.ranker.search(query=query.text, top_k=5)
+        return self.assembler.assemble_definition(
+            query=query,
+            retrieved_sections=retrieved_sections,
+            query_id=f"golden_test_{next(self._query_ids)}"
+        )
+    
+    @staticmethod
+    def _error_detail(test_case: Dict, error: Exception) -> GoldenCaseDetail:
+        """Build the detail record for a test case that raised."""
+        return GoldenCaseDetail(
+            test=test_case["description"],
+            query=test_case["query"],
+            status="ERROR",
+            error=str(error),
+        )
+    
+    @staticmethod
+    def _tally(details: List[GoldenCaseDetail]) -> Dict[str, any]:
+        """Summarize detail records into passed/failed/total counts."""
+        passed = sum(1 for detail in details if detail.status == "PASS")
+        return {
+            "passed": passed,
+            "failed": len(details) - passed,
+            "total": len(details),
+            "details": details
         }
+    
+    def _router_detail(self, test_case: Dict, routing_info: Dict) -> GoldenCaseDetail:
+        """Check the router's query type classification for a test case."""
+        expected_type = test_case["expected_type"]
+        # Models here use use_enum_values, so the router may hand back the plain
+        # value; normalise to the member so identity is enough
+        actual_type = QueryType(routing_info["query_type"])
+        matched = actual_type is expected_type
+        return GoldenCaseDetail(
+            test=test_case["description"],
+            query=test_case["query"],
+            status="PASS" if matched else "FAIL",
+            expected_type=expected_type,
+            actual_type=actual_type,
+            confidence=routing_info["confidence"],
+        )
+    
+    def _definition_details(self, outcomes: List[Any]) -> List[GoldenCaseDetail]:
+        """Validate definition outcomes (responses or raised errors) in test case order."""
+        answered = [i for i, outcome in enumerate(outcomes) if isinstance(outcome, QueryResponse)]
         
-        all_tests = self.definition_tests + self.concept_tests + self.troubleshooting_tests
+        # Confidence thresholds are checked for every response in one comparison
+        confidences = np.fromiter(
+            (outcomes[i].confidence for i in answered), dtype=np.float64, count=len(answered)
+        )
+        minimums = np.fromiter(
+            (self.definition_tests[i]["expected_confidence_min"] for i in answered),
+            dtype=np.float64,
+            count=len(answered),
+        )
+        low_confidence = dict(zip(answered, (confidences < minimums).tolist()))
         
-        for test_case in all_tests:
-            results["total"] += 1
-            
+        details = []
+        for i, (test_case, outcome) in enumerate(zip(self.definition_tests, outcomes)):
+            if isinstance(outcome, Exception):
+                details.append(self._error_detail(test_case, outcome))
+                continue
             try:
-                query = Query(text=test_case["query"])
-                routing_info = self.router.route_query(query)
-                
-                # Check query type classification
-                if routing_info["query_type"] == test_case["expected_type"]:
-                    results["passed"] += 1
-                    status = "PASS"
-                else:
-                    results["failed"] += 1
-                    status = "FAIL"
-                
-                results["details"].append({
-                    "test": test_case["description"],
-                    "query": test_case["query"],
-                    "expected_type": test_case["expected_type"],
-                    "actual_type": routing_info["query_type"],
-                    "confidence": routing_info["confidence"],
-                    "status": status
-                })
-                
+                details.append(self._definition_detail(test_case, outcome, low_confidence[i]))
             except Exception as e:
-                results["failed"] += 1
-                results["details"].append({
-                    "test": test_case["description"],
-                    "query": test_case["query"],
-                    "error": str(e),
-                    "status": "ERROR"
-                })
-        
-        return results
+                details.append(self._error_detail(test_case, e))
+        return details
     
-    def test_definition_queries(self) -> Dict[str, any]:
-        """Test definition query processing."""
-        results = {
-            "passed": 0,
-            "failed": 0,
-            "total": 0,
-            "details": []
-        }
+    def _definition_detail(
+        self,
+        test_case: Dict,
+        response: QueryResponse,
+        low_confidence: bool
+    ) -> GoldenCaseDetail:
+        """Validate an assembled definition response against a test case."""
+        # Read each response field once
+        confidence = response.confidence
+        response_type = response.response_type
+        citations = response.citations
+        definition = response.content.get("definition")
         
-        for test_case in self.definition_tests:
-            results["total"] += 1
-            
-            try:
-                query = Query(text=test_case["query"])
-                
-                # Route query
-                routing_info = self.router.route_query(query)
-                
-                # Retrieve sections
-                retrieved_sections = self.ranker.search(
-                    query=query.text,
-                    top_k=5
-                )
-                
-                # Assemble response
-                query_id = f"golden_test_{int(time.time() * 1000)}"
-                response = self.assembler.assemble_definition(
-                    query=query,
-                    retrieved_sections=retrieved_sections,
-                    query_id=query_id
-                )
-                
-                # Validate response
-                passed = True
-                issues = []
-                
-                # Check confidence
-                if response.confidence < test_case["expected_confidence_min"]:
-                    passed = False
-                    issues.append(f"Low confidence: {response.confidence:.2f} < {test_case['expected_confidence_min']}")
-                
-                # Check response type
-                if response.response_type != QueryType.DEFINITION:
-                    passed = False
-                    issues.append(f"Wrong response type: {response.response_type}")
-                
-                # Check content
-                if not response.content.get("definition"):
-                    passed = False
-                    issues.append("No definition in response")
-                
-                # Check citations
-                if not response.citations:
-                    passed = False
-                    issues.append("No citations in response")
-                
-                if passed:
-                    results["passed"] += 1
-                    status = "PASS"
-                else:
-                    results["failed"] += 1
-                    status = "FAIL"
-                
-                results["details"].append({
-                    "test": test_case["description"],
-                    "query": test_case["query"],
-                    "confidence": response.confidence,
-                    "processing_time_ms": response.processing_time_ms,
-                    "citations_count": len(response.citations),
-                    "issues": issues,
-                    "status": status
-                })
-                
-            except Exception as e:
-                results["failed"] += 1
-                results["details"].append({
-                    "test": test_case["description"],
-                    "query": test_case["query"],
-                    "error": str(e),
-                    "status": "ERROR"
-                })
+        passed = True
+        issues = []
         
-        return results
+        # Check confidence
+        if low_confidence:
+            passed = False
+            issues.append(f"Low confidence: {confidence:.2f} < {test_case['expected_confidence_min']}")
+        
+        # Check response type
+        if response_type != QueryType.DEFINITION:
+            passed = False
+            issues.append(f"Wrong response type: {response_type}")
+        
+        # Check content
+        if not definition:
+            passed = False
+            issues.append("No definition in response")
+        
+        # Check citations
+        if not citations:
+            passed = False
+            issues.append("No citations in response")
+        
+        return GoldenCaseDetail(
+            test=test_case["description"],
+            query=test_case["query"],
+            status="PASS" if passed else "FAIL",
+            confidence=confidence,
+            processing_time_ms=response.processing_time_ms,
+            citations_count=len(citations),
+            issues=issues,
+        )
     
-    def test_performance_metrics(self) -> Dict[str, any]:
-        """Test performance metrics."""
+    @staticmethod
+    def _performance_results(times_ns: np.ndarray) -> Dict[str, any]:
+        """Reduce per-query pipeline timings into performance metrics."""
         results = {
             "avg_processing_time_ms": 0.0,
             "max_processing_time_ms": 0.0,
-            "min_processing_time_ms": float('inf'),
+            "min_processing_time_ms": 0.0,
             "total_queries": 0,
             "performance_threshold_ms": 500,  # 500ms threshold
             "passed": 0,
             "failed": 0
         }
         
-        all_tests = self.definition_tests + self.concept_tests + self.troubleshooting_tests
+        # Reduce all timings at once (monotonic ns -> ms)
+        if times_ns.size:
+            times_ms = times_ns / 1e6
+            passed = int((times_ms <= results["performance_threshold_ms"]).sum())
+            results.update({
+                "avg_processing_time_ms": float(times_ms.mean()),
+                "max_processing_time_ms": float(times_ms.max()),
+                "min_processing_time_ms": float(times_ms.min()),
+                "total_queries": int(times_ns.size),
+                "passed": passed,
+                "failed": int(times_ns.size) - passed,
+            })
         
-        for test_case in all_tests:
+        return results
+    
+    def test_router_classification(self) -> Dict[str, any]:
+        """Test query classification by the router."""
+        details = []
+        for test_case in self.all_tests:
             try:
-                start_time = time.time() * 1000
-                
-                query = Query(text=test_case["query"])
-                routing_info = self.router.route_query(query)
-                retrieved_sections = self.ranker.search(query=query.text, top_k=5)
-                
-                query_id = f"perf_test_{int(time.time() * 1000)}"
-                response = self.assembler.assemble_definition(
-                    query=query,
-                    retrieved_sections=retrieved_sections,
-                    query_id=query_id
-                )
-                
-                processing_time = time.time() * 1000 - start_time
-                results["total_queries"] += 1
-                results["avg_processing_time_ms"] += processing_time
-                results["max_processing_time_ms"] = max(results["max_processing_time_ms"], processing_time)
-                results["min_processing_time_ms"] = min(results["min_processing_time_ms"], processing_time)
-                
-                if processing_time <= results["performance_threshold_ms"]:
-                    results["passed"] += 1
-                else:
-                    results["failed"] += 1
-                
+                routing_info = self.router.route_query(self._query_for(test_case))
+                details.append(self._router_detail(test_case, routing_info))
             except Exception as e:
-                self.logger.error(f"Performance test failed for {test_case['query']}: {e}")
+                details.append(self._error_detail(test_case, e))
         
-        if results["total_queries"] > 0:
-            results["avg_processing_time_ms"] /= results["total_queries"]
+        return self._tally(details)
+    
+    async def test_definition_queries(self) -> Dict[str, any]:
+        """Test definition query processing."""
+        # Cases are independent, so overlap their retrieval and assembly in
+        # worker threads (the dense encode releases the GIL)
+        semaphore = asyncio.Semaphore(8)
         
-        if results["min_processing_time_ms"] == float('inf'):
-            results["min_processing_time_ms"] = 0.0
+        async def run_case(test_case: Dict) -> Any:
+            async with semaphore:
+                return await asyncio.to_thread(self._check_definition_case, test_case)
         
-        return results
+        outcomes = await asyncio.gather(*(run_case(tc) for tc in self.definition_tests))
+        return self._tally(self._definition_details(list(outcomes)))
+    
+    def _check_definition_case(self, test_case: Dict) -> Any:
+        """Run one definition test case, returning its response or the error it raised."""
+        try:
+            query = self._query_for(test_case)
+            self.router.route_query(query)
+            return self._answer(query)
+        except Exception as e:
+            return e
+    
+    def test_performance_metrics(self) -> Dict[str, any]:
+        """Test performance metrics."""
+        # Filled in place; only the first `timed` slots hold successful runs
+        times_ns = np.empty(len(self.all_tests), dtype=np.int64)
+        timed = 0
+        for test_case in self.all_tests:
+            try:
+                start_ns = time.perf_counter_ns()
+                query = self._query_for(test_case)
+                self.router.route_query(query)
+                self._answer(query)
+                times_ns[timed] = time.perf_counter_ns() - start_ns
+                timed += 1
+            except Exception as e:
+                self.logger.error(f"Performance test failed for {test_case['query']}: {e}")
+        
+        return self._performance_results(times_ns[:timed])
     
     async def run_all_tests(self) -> Dict[str, any]:
         """Run all golden tests and return comprehensive results."""
@@ -309,16 +394,52 @@ class GoldenTestSuite:
         if not await self.setup():
             return {"error": "Failed to setup test environment"}
         
-        # Run tests
-        router_results = self.test_router_classification()
-        definition_results = self.test_definition_queries()
-        performance_results = self.test_performance_metrics()
+        # Run each case through route -> retrieve -> assemble exactly once and
+        # derive the router, definition and performance results from that pass
+        router_details = []
+        definition_outcomes = []
+        # Filled in place; only the first `timed` slots hold successful runs
+        times_ns = np.empty(len(self.all_tests), dtype=np.int64)
+        timed = 0
+        for index, test_case in enumerate(self.all_tests):
+            is_definition = index < len(self.definition_tests)  # all_tests leads with them
+            routing_info = response = error = None
+            try:
+                start_ns = time.perf_counter_ns()
+                query = self._query_for(test_case)
+                routing_info = self.router.route_query(query)
+                response = self._answer(query)
+                times_ns[timed] = time.perf_counter_ns() - start_ns
+                timed += 1
+            except Exception as e:
+                error = e
+                self.logger.error(f"Performance test failed for {test_case['query']}: {e}")
+            
+            # Routing itself raised; a later retrieval error still leaves a routing result to check
+            if error is not None and routing_info is None:
+                router_details.append(self._error_detail(test_case, error))
+            else:
+                try:
+                    router_details.append(self._router_detail(test_case, routing_info))
+                except Exception as e:
+                    router_details.append(self._error_detail(test_case, e))
+            
+            if is_definition:
+                definition_outcomes.append(response if response is not None else error)
+        
+        router_results = self._tally(router_details)
+        definition_results = self._tally(self._definition_details(definition_outcomes))
+        performance_results = self._performance_results(times_ns[:timed])
         
         # Compile results
         total_tests = router_results["total"] + definition_results["total"]
         total_passed = router_results["passed"] + definition_results["passed"]
         total_failed = router_results["failed"] + definition_results["failed"]
         
+        # Details stay as records while the tests run; convert once for the report
+        for section_results in (router_results, definition_results):
+            section_results["details"] = [detail.to_dict() for detail in section_results["details"]]
+        
         overall_results = {
             "timestamp": time.time(),
             "summary": {
@@ -338,11 +459,11 @@ class GoldenTestSuite:
 
 
 # Pytest fixtures and tests
-@pytest.fixture
-async def golden_test_suite():
-    """Fixture for golden test suite."""
+@pytest.fixture(scope="session")
+def golden_test_suite():
+    """Fixture for golden test suite, set up once per test session."""
     suite = GoldenTestSuite()
-    await suite.setup()
+    asyncio.run(suite.setup())
     return suite
 
 
@@ -358,7 +479,7 @@ async def test_router_classification(golden_test_suite):
 @pytest.mark.asyncio
 async def test_definition_queries(golden_test_suite):
     """Test definition query processing."""
-    results = golden_test_suite.test_definition_queries()
+    results = await golden_test_suite.test_definition_queries()
     assert results["failed"] == 0, f"Definition queries failed: {results['details']}"
 
 
@@ -385,6 +506,7 @@ if __name__ == "__main__":
     async def main():
         suite = GoldenTestSuite()
         results = await suite.run_all_tests()
-        print(json.dumps(results, indent=2))
+        # orjson emits str-enums such as QueryType natively; anything else is stringified
+        print(orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2).decode())
     
     asyncio.run(main()) 
\ No newline at end of file
@@ -1,12 +1,14 @@
 from pathlib import Path
 import re
-import json
-import numpy as np
+import orjson
 from ae2.rfc.index_builder import build_index
 
+# Compiled once; tokenize_text runs for every section in the corpus
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
 def tokenize_text(text: str) -> list[str]:
     """Simple, deterministic tokenizer for BM25."""
-    return re.findall(r"[a-z0-9]+", text.lower())
+    return _TOKEN_RE.findall(text.lower())
 
 if __name__ == "__main__":
     out = Path("data/index"); out.mkdir(parents=True, exist_ok=True)
@@ -15,11 +17,10 @@ if __name__ == "__main__":
     # Persist BM25 tokens
     sections_path = out / "sections.jsonl"
     if sections_path.exists():
-        import json
-        sections = []
-        with sections_path.open() as f:
-            for line in f:
-                sections.append(json.loads(line))
+        import numpy as np
+        
+        with sections_path.open("rb") as f:
+            sections = [orjson.loads(line) for line in f]
         
         # Tokenize each section
         corpus_tokens = []
@@ -28,15 +29,28 @@ if __name__ == "__main__":
             tokens = tokenize_text(text)
             corpus_tokens.append(tokens)
         
-        # Save tokens and metadata
-        np.save(out / "bm25_tokens.npy", np.array(corpus_tokens, dtype=object))
+        # Save tokens as vocabulary ids in a CSR layout: the ids for section i
+        # are bm25_token_ids[offsets[i]:offsets[i + 1]]
+        vocab: dict[str, int] = {}
+        token_ids = np.fromiter(
+            (vocab.setdefault(t, len(vocab)) for tokens in corpus_tokens for t in tokens),
+            dtype=np.int32,
+        )
+        offsets = np.zeros(len(corpus_tokens) + 1, dtype=np.int64)
+        np.cumsum([len(tokens) for tokens in corpus_tokens], out=offsets[1:])
+        np.save(out / "bm25_token_ids.npy", token_ids)
+        np.save(out / "bm25_offsets.npy", offsets)
+        (out / "bm25_vocab.json").write_bytes(orjson.dumps(list(vocab)))
+        
+        # Save metadata
         bm25_meta = {
             "section_count": len(sections),
+            "vocab_size": len(vocab),
+            "token_layout": "csr_int32",
             "tokenizer_version": "simple_regex",
-            "tokenizer_pattern": r"[a-z0-9]+"
+            "tokenizer_pattern": _TOKEN_RE.pattern
         }
-        with (out / "bm25_meta.json").open("w") as f:
-            json.dump(bm25_meta, f, indent=2)
+        (out / "bm25_meta.json").write_bytes(orjson.dumps(bm25_meta, option=orjson.OPT_INDENT_2))
         
         print(f"[OK] BM25 tokens persisted: {len(corpus_tokens)} sections")
     
@@ -0,0 +1,21 @@
+"""
+Shared fixtures for the AE v2 test suite.
+"""
+
+import pytest
+from pathlib import Path
+
+from ae2.retriever.index_store import IndexStore
+
+
+@pytest.fixture(scope="session")
+def index_store():
+    """Load the index store once for every test that needs it."""
+    index_dir = Path("data/index")
+    if not index_dir.exists():
+        pytest.skip("Index not found - run scripts/build_index.py first")
+
+    try:
+        return IndexStore(str(index_dir))
+    except Exception as e:
+        pytest.skip(f"Failed to load index: {e}")
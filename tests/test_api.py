@@ -0,0 +1,49 @@
+"""
+Tests for the API response rendering.
+
+Tests verify that handlers can return numpy values through the app's
+default orjson response class.
+"""
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ae2.api.main import ORJSONResponse
+
+
+def _numpy_app() -> FastAPI:
+    """Build a minimal app with the same default response class as ae2.api.main."""
+    app = FastAPI(default_response_class=ORJSONResponse)
+
+    @app.get("/score")
+    def score():
+        return {"score": np.float64(0.75)}
+
+    @app.get("/scores")
+    def scores():
+        return ORJSONResponse({
+            "float32": np.float32(0.5),
+            "int64": np.int64(3),
+            "array": np.arange(3),
+        })
+
+    return app
+
+
+class TestORJSONResponse:
+    """Test the orjson default response class."""
+
+    def test_numpy_scalar_from_handler(self):
+        """Test a numpy scalar returned by a handler."""
+        response = TestClient(_numpy_app()).get("/score")
+
+        assert response.status_code == 200
+        assert response.json() == {"score": 0.75}
+
+    def test_numpy_values_rendered_directly(self):
+        """Test numpy scalars and arrays rendered by the response class."""
+        response = TestClient(_numpy_app()).get("/scores")
+
+        assert response.status_code == 200
+        assert response.json() == {"float32": 0.5, "int64": 3, "array": [0, 1, 2]}
@@ -16,6 +16,24 @@ from ae2.contracts.settings import settings
 from ae2.router.definitional_router import DefinitionalRouter
 from ae2.assembler.definition_assembler import DefinitionAssembler
 
+# One timestamp for every model built in this module
+_NOW = datetime.utcnow()
+
+# Valid SHA256 hash
+_FAKE_SHA256 = "a" * 64
+
+
+@pytest.fixture(scope="module")
+def router():
+    """Router shared by every test in this module."""
+    return DefinitionalRouter()
+
+
+@pytest.fixture(scope="module")
+def assembler():
+    """Assembler shared by every test in this module."""
+    return DefinitionAssembler()
+
 
 class TestContracts:
     """Test Pydantic model contracts."""
@@ -28,8 +46,8 @@ class TestContracts:
             title="Introduction",
             excerpt="ARP is a protocol for mapping IP addresses to MAC addresses.",
             url="https://www.rfc-editor.org/rfc/rfc826.xml#section-1.1",
-            hash="a" * 64,  # Valid SHA256 hash
-            built_at=datetime.utcnow()
+            hash=_FAKE_SHA256,
+            built_at=_NOW
         )
         
         assert section.rfc_number == 826
@@ -48,7 +66,7 @@ class TestContracts:
                 excerpt="ARP is a protocol for mapping IP addresses to MAC addresses.",
                 url="https://www.rfc-editor.org/rfc/rfc826.xml#section-1.1",
                 hash="invalid_hash",
-                built_at=datetime.utcnow()
+                built_at=_NOW
             )
     
     def test_query_creation(self):
@@ -68,7 +86,7 @@ class TestContracts:
         evidence = Evidence(
             type=EvidenceType.RFC_SECTION,
             path_or_url="https://www.rfc-editor.org/rfc/rfc826.xml#section-1.1",
-            sha256="a" * 64,
+            sha256=_FAKE_SHA256,
             excerpt="ARP is a protocol for mapping IP addresses to MAC addresses."
         )
         
@@ -88,7 +106,7 @@ class TestContracts:
         card = ConceptCard(
             id="concept:arp:v1",
             definition=definition,
-            built_at=datetime.utcnow()
+            built_at=_NOW
         )
         
         assert card.id == "concept:arp:v1"
@@ -111,44 +129,34 @@ class TestContracts:
 class TestRouter:
     """Test DefinitionalRouter functionality."""
     
-    def setup_method(self):
-        """Setup router for each test."""
-        self.router = DefinitionalRouter()
-    
-    def test_definition_query_classification(self):
-        """Test classification of definition queries."""
-        query = Query(text="What is ARP?")
-        routing_info = self.router.route_query(query)
-        
-        assert routing_info["query_type"] == QueryType.DEFINITION
-        assert routing_info["confidence"] > 0.5
-        assert routing_info["handler"] == "definition_assembler"
-        assert routing_info["requires_strict_mode"] == True
-    
-    def test_concept_query_classification(self):
-        """Test classification of concept queries."""
-        query = Query(text="Compare ARP and DNS")
-        routing_info = self.router.route_query(query)
+    @pytest.mark.parametrize(
+        "text,query_type,handler,min_confidence,protocol_terms",
+        [
+            ("What is ARP?", QueryType.DEFINITION, "definition_assembler", 0.5, []),
+            ("Compare ARP and DNS", QueryType.CONCEPT, "concept_assembler", 0.5, ["arp", "dns"]),
+            ("OSPF neighbor down", QueryType.TROUBLESHOOTING, "troubleshooting_assembler", 0.4, ["ospf"]),
+        ],
+        ids=["definition", "concept", "troubleshooting"],
+    )
+    def test_query_classification(self, router, text, query_type, handler, min_confidence, protocol_terms):
+        """Test classification of definition, concept and troubleshooting queries."""
+        routing_info = router.route_query(Query(text=text))
         
-        assert routing_info["query_type"] == QueryType.CONCEPT
-        assert routing_info["confidence"] > 0.5
-        assert routing_info["handler"] == "concept_assembler"
-        assert "arp" in routing_info["context"]["protocol_terms"]
-        assert "dns" in routing_info["context"]["protocol_terms"]
+        assert routing_info["query_type"] == query_type
+        assert routing_info["confidence"] > min_confidence
+        assert routing_info["handler"] == handler
+        for term in protocol_terms:
+            assert term in routing_info["context"]["protocol_terms"]
     
-    def test_troubleshooting_query_classification(self):
-        """Test classification of troubleshooting queries."""
-        query = Query(text="OSPF neighbor down")
-        routing_info = self.router.route_query(query)
+    def test_definition_query_requires_strict_mode(self, router):
+        """Test that definition queries are routed in strict mode."""
+        routing_info = router.route_query(Query(text="What is ARP?"))
         
-        assert routing_info["query_type"] == QueryType.TROUBLESHOOTING
-        assert routing_info["confidence"] > 0.4
-        assert routing_info["handler"] == "troubleshooting_assembler"
-        assert "ospf" in routing_info["context"]["protocol_terms"]
+        assert routing_info["requires_strict_mode"] == True
     
-    def test_router_stats(self):
+    def test_router_stats(self, router):
         """Test router statistics."""
-        stats = self.router.get_router_stats()
+        stats = router.get_router_stats()
         
         assert "definition_patterns" in stats
         assert "concept_patterns" in stats
@@ -160,19 +168,15 @@ class TestRouter:
 class TestAssembler:
     """Test DefinitionAssembler functionality."""
     
-    def setup_method(self):
-        """Setup assembler for each test."""
-        self.assembler = DefinitionAssembler()
-    
-    def test_contains_definition(self):
+    def test_contains_definition(self, assembler):
         """Test definition detection in text."""
         definition_text = "ARP is defined as a protocol for mapping IP addresses to MAC addresses."
         non_definition_text = "This is just some random text about networking."
         
-        assert self.assembler._contains_definition(definition_text) == True
-        assert self.assembler._contains_definition(non_definition_text) == False
+        assert assembler._contains_definition(definition_text) == True
+        assert assembler._contains_definition(non_definition_text) == False
     
-    def test_high_quality_definition_detection(self):
+    def test_high_quality_definition_detection(self, assembler):
         """Test high-quality definition detection."""
         section = RFCSection(
             rfc_number=826,
@@ -180,15 +184,15 @@ class TestAssembler:
             title="Introduction",
             excerpt="ARP is defined as a protocol for mapping IP addresses to MAC addresses. This protocol operates at the data link layer and provides a mechanism for hosts to discover the MAC address associated with a given IP address.",
             url="https://www.rfc-editor.org/rfc/rfc826.xml#section-1.1",
-            hash="a" * 64,
-            built_at=datetime.utcnow()
+            hash=_FAKE_SHA256,
+            built_at=_NOW
         )
         
-        assert self.assembler._is_high_quality_definition(section) == True
+        assert assembler._is_high_quality_definition(section) == True
     
-    def test_assembler_stats(self):
+    def test_assembler_stats(self, assembler):
         """Test assembler statistics."""
-        stats = self.assembler.get_assembler_stats()
+        stats = assembler.get_assembler_stats()
         
         assert "strict_mode" in stats
         assert "definition_indicators" in stats
@@ -225,11 +229,8 @@ class TestSettings:
 class TestIntegration:
     """Test basic integration between components."""
     
-    def test_router_to_assembler_flow(self):
+    def test_router_to_assembler_flow(self, router, assembler):
         """Test basic flow from router to assembler."""
-        router = DefinitionalRouter()
-        assembler = DefinitionAssembler()
-        
         # Create a test query
         query = Query(text="What is ARP?")
         
@@ -247,8 +248,8 @@ class TestIntegration:
             title="Introduction",
             excerpt="ARP is defined as a protocol for mapping IP addresses to MAC addresses.",
             url="https://www.rfc-editor.org/rfc/rfc826.xml#section-1.1",
-            hash="a" * 64,
-            built_at=datetime.utcnow()
+            hash=_FAKE_SHA256,
+            built_at=_NOW
         )
         
         retrieved_sections = [(mock_section, 0.8)]
@@ -18,18 +18,6 @@ from ae2.retriever.index_store import IndexStore
 class TestConceptCards:
     """Test concept card functionality."""
 
-    @pytest.fixture(scope="class")
-    def index_store(self):
-        """Load index store for testing."""
-        index_dir = Path("data/index")
-        if not index_dir.exists():
-            pytest.skip("Index not found - run scripts/build_index.py first")
-
-        try:
-            return IndexStore(str(index_dir))
-        except Exception as e:
-            pytest.skip(f"Failed to load index: {e}")
-
     @pytest.fixture(scope="class")
     def concept_store(self, tmp_path_factory):
         """Create a temporary concept store for testing."""
@@ -206,124 +194,119 @@ class TestConceptAPI:
         from fastapi.testclient import TestClient
         from ae2.api.main import app
 
-        # Set up test environment
-        import os
-
-        os.environ["AE_INDEX_DIR"] = str(Path("data/index").resolve())
-        os.environ["ENABLE_DENSE"] = "0"
+        # Set up test environment, restored once the class is done
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("AE_INDEX_DIR", str(Path("data/index").resolve()))
+            mp.setenv("ENABLE_DENSE", "0")
 
-        return TestClient(app)
+            # Enter once so the app lifespan (index and concept store load) runs
+            # once for the class rather than once per test
+            with TestClient(app) as client:
+                yield client
 
     def test_compile_concept_api(self, api_client):
         """Test POST /concepts/compile endpoint."""
-        with api_client as client:
-            response = client.post("/concepts/compile?slug=arp")
+        response = api_client.post("/concepts/compile?slug=arp")
 
-            assert response.status_code == 200
-            data = response.json()
+        assert response.status_code == 200
+        data = response.json()
 
-            assert data["id"].startswith("concept:arp:")
-            assert data["definition"]["rfc_number"] in [826, 1812]
-            assert len(data["definition"]["text"]) > 0
-            assert "claims" in data
-            assert "provenance" in data
+        assert data["id"].startswith("concept:arp:")
+        assert data["definition"]["rfc_number"] in [826, 1812]
+        assert len(data["definition"]["text"]) > 0
+        assert "claims" in data
+        assert "provenance" in data
 
     def test_get_concept_api(self, api_client):
         """Test GET /concepts/{id} endpoint."""
-        with api_client as client:
-            # First compile a concept
-            compile_response = client.post("/concepts/compile?slug=arp")
-            assert compile_response.status_code == 200
-            card_id = compile_response.json()["id"]
+        # First compile a concept
+        compile_response = api_client.post("/concepts/compile?slug=arp")
+        assert compile_response.status_code == 200
+        card_id = compile_response.json()["id"]
 
-            # Then retrieve it
-            response = client.get(f"/concepts/{card_id}")
-            assert response.status_code == 200
-            data = response.json()
+        # Then retrieve it
+        response = api_client.get(f"/concepts/{card_id}")
+        assert response.status_code == 200
+        data = response.json()
 
-            assert data["id"] == card_id
-            assert data["definition"]["rfc_number"] in [826, 1812]
+        assert data["id"] == card_id
+        assert data["definition"]["rfc_number"] in [826, 1812]
 
     def test_debug_concept_api(self, api_client):
         """Test GET /debug/concept/{id} endpoint."""
-        with api_client as client:
-            # First compile a concept
-            compile_response = client.post("/concepts/compile?slug=arp")
-            assert compile_response.status_code == 200
-            card_id = compile_response.json()["id"]
-
-            # Then get debug info
-            response = client.get(f"/debug/concept/{card_id}")
-            assert response.status_code == 200
-            data = response.json()
-
-            assert "card" in data
-            assert "retrieval_trace" in data
-            assert data["card"]["id"] == card_id
-
-            # Check retrieval trace
-            trace = data["retrieval_trace"]
-            assert "slug" in trace
-            assert "target_rfcs" in trace
-            assert "top_hits" in trace
-            assert len(trace["top_hits"]) > 0
-
-            # Check that top hits have scores
-            for hit in trace["top_hits"]:
-                assert "scores" in hit
-                scores = hit["scores"]
-                assert "tfidf" in scores
-                assert "bm25" in scores
-                assert "hybrid" in scores
+        # First compile a concept
+        compile_response = api_client.post("/concepts/compile?slug=arp")
+        assert compile_response.status_code == 200
+        card_id = compile_response.json()["id"]
+
+        # Then get debug info
+        response = api_client.get(f"/debug/concept/{card_id}")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert "card" in data
+        assert "retrieval_trace" in data
+        assert data["card"]["id"] == card_id
+
+        # Check retrieval trace
+        trace = data["retrieval_trace"]
+        assert "slug" in trace
+        assert "target_rfcs" in trace
+        assert "top_hits" in trace
+        assert len(trace["top_hits"]) > 0
+
+        # Check that top hits have scores
+        for hit in trace["top_hits"]:
+            assert "scores" in hit
+            scores = hit["scores"]
+            assert "tfidf" in scores
+            assert "bm25" in scores
+            assert "hybrid" in scores
 
     def test_list_concepts_api(self, api_client):
         """Test GET /concepts endpoint."""
-        with api_client as client:
-            # Compile a concept first
-            client.post("/concepts/compile?slug=arp")
+        # Compile a concept first
+        api_client.post("/concepts/compile?slug=arp")
 
-            # List concepts
-            response = client.get("/concepts")
-            assert response.status_code == 200
-            data = response.json()
+        # List concepts
+        response = api_client.get("/concepts")
+        assert response.status_code == 200
+        data = response.json()
 
-            assert "concept_ids" in data
-            assert isinstance(data["concept_ids"], list)
-            assert any("concept:arp:" in cid for cid in data["concept_ids"])
+        assert "concept_ids" in data
+        assert isinstance(data["concept_ids"], list)
+        assert any("concept:arp:" in cid for cid in data["concept_ids"])
 
     def test_get_nonexistent_concept(self, api_client):
         """Test getting a nonexistent concept."""
-        with api_client as client:
-            response = client.get("/concepts/concept:nonexistent:v1")
-            assert response.status_code == 404
+        response = api_client.get("/concepts/concept:nonexistent:v1")
+        assert response.status_code == 404
 
     def test_compile_invalid_slug_api(self, api_client):
         """Test compiling with invalid slug via API."""
-        with api_client as client:
-            response = client.post("/concepts/compile?slug=xyz123nonexistent")
-            assert response.status_code == 400
+        response = api_client.post("/concepts/compile?slug=xyz123nonexistent")
+        assert response.status_code == 400
 
     def test_debug_index_includes_concepts(self, api_client):
         """Test that /debug/index includes concept counts and hashes."""
-        with api_client as client:
-            # Compile a concept first
-            client.post("/concepts/compile?slug=arp")
-
-            # Check debug index
-            response = client.get("/debug/index")
-            assert response.status_code == 200
-            data = response.json()
-
-            # Verify concept fields are present
-            assert "concepts_count" in data
-            assert "concepts_root_hash" in data
-            assert isinstance(data["concepts_count"], int)
-            assert data["concepts_count"] >= 1  # Should have at least the ARP concept
-
-            # If concepts exist, hash should be present
-            if data["concepts_count"] > 0:
-                assert data["concepts_root_hash"] is not None
-                assert len(data["concepts_root_hash"]) == 64  # SHA256 hex length
+        # Compile a concept first
+        api_client.post("/concepts/compile?slug=arp")
+
+        # Check debug index
+        response = api_client.get("/debug/index")
+        assert response.status_code == 200
+        data = response.json()
+
+        # Verify concept fields are present
+        assert "concepts_count" in data
+        assert "concepts_root_hash" in data
+        assert isinstance(data["concepts_count"], int)
+        assert data["concepts_count"] >= 1  # Should have at least the ARP concept
+
+        # If concepts exist, hash should be present
+        if data["concepts_count"] > 0:
+            assert data["concepts_root_hash"] is not None
+            assert len(data["concepts_root_hash"]) == 64  # SHA256 hex length
 
 
 if __name__ == "__main__":
@@ -0,0 +1,162 @@
+"""
+Tests for the RFC section loader in the index builder.
+
+Tests cover line iteration, batch parsing, the parse cache and the
+stats and validation paths built on it.
+"""
+
+import asyncio
+import mmap
+
+import orjson
+import pytest
+
+from ae2.contracts.settings import settings
+from ae2.storage import index_builder
+from ae2.storage.index_builder import (
+    IndexBuilder,
+    _iter_lines,
+    _parse_sections,
+)
+
+
+def _record(n: int) -> bytes:
+    """Serialize a valid RFC section record as one JSONL line."""
+    return orjson.dumps({
+        "rfc_number": 826,
+        "section": str(n),
+        "title": f"Section {n}",
+        "excerpt": f"ARP section {n} excerpt.",
+        "url": f"https://www.rfc-editor.org/rfc/rfc826.xml#section-{n}",
+        "hash": f"{n:064x}",
+        "built_at": "2024-01-01T00:00:00",
+    })
+
+
+def _lines(path):
+    """Collect _iter_lines output for a file."""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        return list(_iter_lines(buf))
+
+
+@pytest.fixture
+def builder(tmp_path, monkeypatch):
+    """Create an index builder rooted in a temporary directory."""
+    monkeypatch.setattr(settings, "rfc_dir", tmp_path / "rfc_index")
+    monkeypatch.setattr(settings, "index_dir", tmp_path / "index")
+    settings.rfc_dir.mkdir()
+    return IndexBuilder()
+
+
+class TestIterLines:
+    """Test iterating over JSONL lines in a memory map."""
+
+    def test_blank_lines_skipped(self, tmp_path):
+        """Test that blank lines are skipped without shifting line numbers."""
+        path = tmp_path / "sections.jsonl"
+        path.write_bytes(b"a\n\n  \nb\n")
+
+        assert _lines(path) == [(1, b"a"), (4, b"b")]
+
+    def test_missing_trailing_newline(self, tmp_path):
+        """Test that the last line is yielded without a trailing newline."""
+        path = tmp_path / "sections.jsonl"
+        path.write_bytes(b"a\nbc")
+
+        assert _lines(path) == [(1, b"a"), (2, b"bc")]
+
+
+class TestParseSections:
+    """Test parsing RFC sections from a JSONL file."""
+
+    def test_bad_lines_reported(self, tmp_path):
+        """Test that invalid lines are reported and valid ones still load."""
+        path = tmp_path / "sections.jsonl"
+        bad = orjson.loads(_record(2))
+        bad["hash"] = "invalid_hash"
+        path.write_bytes(b"\n".join([
+            _record(1), b"{not json", orjson.dumps(bad), _record(3),
+        ]) + b"\n")
+
+        sections, errors = _parse_sections(path)
+
+        assert [s.section for s in sections] == ["1", "3"]
+        assert [error.split(":")[0] for error in errors] == [
+            "Failed to parse line 2", "Failed to parse line 3",
+        ]
+
+    def test_multi_record_line_rejected(self, tmp_path):
+        """Test that a line holding several records is not split into sections."""
+        path = tmp_path / "sections.jsonl"
+        path.write_bytes(_record(0) + b"\n" + _record(1) + b"," + _record(2) + b"\n")
+
+        sections, errors = _parse_sections(path)
+
+        assert [s.section for s in sections] == ["0"]
+        assert len(errors) == 1
+
+    def test_batches_match_single_batch(self, tmp_path, monkeypatch):
+        """Test that small validation batches give the same sections."""
+        path = tmp_path / "sections.jsonl"
+        path.write_bytes(b"\n".join(_record(n) for n in range(10)))
+
+        expected, _ = _parse_sections(path)
+        monkeypatch.setattr(index_builder, "VALIDATE_BATCH_LINES", 3)
+        sections, errors = _parse_sections(path)
+
+        assert sections == expected
+        assert errors == []
+
+
+class TestLoadRFCSections:
+    """Test loading RFC sections through the index builder."""
+
+    def test_empty_file(self, builder):
+        """Test that an empty index file loads no sections."""
+        builder.rfc_index_file.write_bytes(b"")
+
+        assert builder._load_rfc_sections() == []
+
+    def test_load_errors_propagate(self, builder):
+        """Test that an unreadable index raises instead of loading as empty."""
+        builder.rfc_index_file.mkdir()
+
+        with pytest.raises(OSError):
+            builder._load_rfc_sections()
+
+
+class TestIndexStats:
+    """Test that stats and validation agree with the loader."""
+
+    def test_rejected_records_not_counted(self, builder):
+        """Test that a record the loader rejects is skipped by stats and validation."""
+        bad = orjson.loads(_record(1))
+        bad["hash"] = "invalid_hash"
+        builder.rfc_index_file.write_bytes(
+            b"\n".join([_record(0), orjson.dumps(bad), _record(2)]) + b"\n"
+        )
+        asyncio.run(builder.build_index())
+
+        stats = builder.get_index_stats()
+
+        assert len(builder.load_documents()) == 2
+        assert stats["document_count"] == stats["manifest"]["document_count"] == 2
+        assert stats["rfc_numbers"] == [826]
+        assert builder.validate_index()
+
+    def test_build_stats_validate_parse_once(self, builder, monkeypatch):
+        """Test that stats and validation reuse the sections parsed by the build."""
+        builder.rfc_index_file.write_bytes(b"\n".join(_record(n) for n in range(3)) + b"\n")
+        batches = []
+        validate_batch = index_builder._validate_batch
+        monkeypatch.setattr(
+            index_builder, "_validate_batch",
+            lambda *args: batches.append(args) or validate_batch(*args),
+        )
+
+        asyncio.run(builder.build_index())
+        stats = builder.get_index_stats()
+
+        assert stats["document_count"] == 3
+        assert builder.validate_index()
+        assert len(batches) == 1